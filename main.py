@@ -2,6 +2,7 @@
 import click
 from src.fix_sim import fix_simulator
 from src.fix_client import market_sim_client
+from src.fix_analysis import log_analyzer
 
 @click.group()
 def cli():
@@ -53,5 +54,26 @@ def client(fix_version, host, port):
     except Exception as e:
         click.echo(f"An error occurred: {e}", err=True)
 
+@cli.command()
+@click.option('--log-file', default=fix_simulator.LOG_FILE, type=click.Path(exists=True, dir_okay=False), help='The simulator log to analyze.')
+@click.option('--bucket', default=60, type=click.IntRange(min=1), help='Width of each time bucket in seconds.')
+@click.option('--workers', default=None, type=click.IntRange(min=1), help='Number of worker processes. Defaults to the number of CPU cores.')
+@click.option('--chunk-mb', default=64, type=click.IntRange(min=1), help='Size of the byte range each worker parses at a time, in MB.')
+def analyze(log_file, bucket, workers, chunk_mb):
+    """
+    Analyze a simulator log offline.
+
+    Streams the wire log (<<< RECV / >>> SEND lines) in parallel byte ranges and
+    reports throughput, fill/partial/reject rates and ack-to-fill latency
+    per persona and symbol over time.
+    Example: python main.py analyze --bucket 300
+    """
+    click.echo(f"Analyzing {log_file} in {bucket}s buckets...")
+    try:
+        report = log_analyzer.analyze_log(log_file, bucket, workers, chunk_mb * 1024 * 1024)
+        click.echo(log_analyzer.format_report(report))
+    except Exception as e:
+        click.echo(f"An error occurred: {e}", err=True)
+
 if __name__ == '__main__':
     cli()
\ No newline at end of file
@@ -0,0 +1,431 @@
+import os
+import time
+import datetime as dt
+import calendar
+import hashlib
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+RECV_MARKER = b"<<< RECV: "
+SEND_MARKER = b">>> SEND: "
+PERSONA_MARKER = b"Running as LP Persona: '"
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Direction codes.
+DIR_RECV, DIR_SEND = 0, 1
+
+# Event kinds derived from MsgType(35) / ExecType(150).
+KIND_OTHER, KIND_ORDER, KIND_ACK, KIND_PARTIAL, KIND_FILL, KIND_REJECT = range(6)
+EXEC_TYPE_KINDS = {b'0': KIND_ACK, b'1': KIND_PARTIAL, b'2': KIND_FILL, b'8': KIND_REJECT}
+
+# Column of each counted kind in a group's [orders, fills, partials, rejects] counts.
+COUNT_COLUMNS = {KIND_ORDER: 0, KIND_FILL: 1, KIND_PARTIAL: 2, KIND_REJECT: 3}
+_COUNT_COLUMN_LOOKUP = np.array([COUNT_COLUMNS.get(kind, -1) for kind in range(6)], dtype=np.int64)
+
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+# --- Line parsing ---
+_DATE_CACHE = {}
+def _sending_time_ms(value: bytes) -> int:
+    """Convert a SendingTime(52) value such as 20240101-12:30:45.123 to epoch milliseconds."""
+    date = value[:8]
+    day_ms = _DATE_CACHE.get(date)
+    if day_ms is None:
+        day = dt.datetime.strptime(date.decode(), "%Y%m%d")
+        day_ms = calendar.timegm(day.timetuple()) * 1000
+        _DATE_CACHE[date] = day_ms
+    ms = int(value[18:21]) if len(value) > 18 else 0
+    return day_ms + (int(value[9:11]) * 3600 + int(value[12:14]) * 60 + int(value[15:17])) * 1000 + ms
+
+
+def _log_time_ms(line: bytes) -> int:
+    """Fall back to the logger's own timestamp (local time, second resolution) when SendingTime is absent."""
+    stamp = dt.datetime.strptime(line[:19].decode(), "%Y-%m-%d %H:%M:%S")
+    return int(time.mktime(stamp.timetuple())) * 1000
+
+
+def _order_key(cl_ord_id: bytes) -> int:
+    # A stable 64-bit key so ClOrdIDs can be joined across worker processes.
+    return int.from_bytes(hashlib.blake2b(cl_ord_id, digest_size=8).digest(), 'little')
+
+
+def _parse_lines(path, start, end):
+    """Parse every wire-log line that starts within [start, end) into columnar arrays.
+
+    Events seen before the first persona line of the range get persona code -1;
+    the caller resolves them from the preceding chunks. Wire lines that cannot
+    be parsed (e.g. a malformed SendingTime) are skipped and counted.
+    """
+    times, directions, kinds = array('q'), array('b'), array('b')
+    personas, symbols, order_keys = array('h'), array('l'), array('Q')
+    persona_codes, symbol_codes = {}, {}
+    persona = -1
+    skipped = 0
+
+    with open(path, 'rb') as f:
+        if start > 0:
+            # Align to the first full line: a line belongs to the chunk it starts in.
+            f.seek(start - 1)
+            pos = start - 1 + len(f.readline())
+        else:
+            pos = 0
+        for line in f:
+            if pos >= end:
+                break
+            pos += len(line)
+
+            if RECV_MARKER in line:
+                direction, marker = DIR_RECV, RECV_MARKER
+            elif SEND_MARKER in line:
+                direction, marker = DIR_SEND, SEND_MARKER
+            else:
+                idx = line.find(PERSONA_MARKER)
+                if idx != -1:
+                    name = line[idx + len(PERSONA_MARKER):].split(b"'", 1)[0].decode(errors='replace')
+                    persona = persona_codes.setdefault(name, len(persona_codes))
+                continue
+
+            fields = {}
+            for pair in line.rstrip().split(marker, 1)[1].split(b'|'):
+                tag, _, value = pair.partition(b'=')
+                if tag in (b'35', b'52', b'11', b'55', b'150'):
+                    fields[tag] = value
+
+            msg_type = fields.get(b'35')
+            if direction == DIR_RECV and msg_type == b'D':
+                kind = KIND_ORDER
+            elif direction == DIR_SEND and msg_type == b'8':
+                kind = EXEC_TYPE_KINDS.get(fields.get(b'150'), KIND_OTHER)
+            else:
+                kind = KIND_OTHER
+
+            sending_time, symbol, cl_ord_id = fields.get(b'52'), fields.get(b'55'), fields.get(b'11')
+            try:
+                time_ms = _sending_time_ms(sending_time) if sending_time else _log_time_ms(line)
+                symbol_name = symbol.decode() if symbol else None
+            except ValueError:
+                skipped += 1
+                continue
+
+            times.append(time_ms)
+            directions.append(direction)
+            kinds.append(kind)
+            personas.append(persona)
+            symbols.append(symbol_codes.setdefault(symbol_name, len(symbol_codes)) if symbol_name else -1)
+            order_keys.append(_order_key(cl_ord_id) if cl_ord_id else 0)
+
+    columns = {
+        'time_ms': np.frombuffer(times, dtype=np.int64),
+        'direction': np.frombuffer(directions, dtype=np.int8),
+        'kind': np.frombuffer(kinds, dtype=np.int8),
+        'persona': np.frombuffer(personas, dtype=np.int16).astype(np.int64),
+        'symbol': np.frombuffer(symbols, dtype=np.dtype(f'i{symbols.itemsize}')).astype(np.int64),
+        'order_key': np.frombuffer(order_keys, dtype=np.dtype(f'u{order_keys.itemsize}')).astype(np.uint64),
+    }
+    return columns, list(persona_codes), list(symbol_codes), persona, skipped
+
+
+# --- Chunk aggregation (runs in worker processes) ---
+def _lookup(sorted_keys, keys):
+    """Return (positions, matched mask) of keys within sorted_keys."""
+    if len(sorted_keys) == 0:
+        return np.zeros(len(keys), np.int64), np.zeros(len(keys), bool)
+    pos = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return pos, sorted_keys[pos] == keys
+
+
+def _aggregate_chunk(path, start, end, bucket_ms):
+    """Reduce one byte range to per-group counts and latency samples.
+
+    Every outcome is attributed to the (bucket, persona, symbol) of the order it
+    answers, joined on ClOrdID. Joins that cross the chunk boundary are left to
+    the caller: orders still awaiting an outcome, acks and outcomes whose order
+    is not in this chunk are returned as-is. Once an order has an outcome it is
+    no longer exported, so a later outcome for it in another chunk is counted in
+    its own bucket.
+    """
+    columns, persona_names, symbol_names, last_persona, skipped = _parse_lines(path, start, end)
+    times, kinds, keys = columns['time_ms'], columns['kind'], columns['order_key']
+    groups = np.stack([times // bucket_ms * bucket_ms, columns['persona'], columns['symbol']], axis=1)
+
+    buckets, bucket_index = np.unique(groups[:, 0], return_inverse=True)
+    bucket_index = bucket_index.ravel()
+    throughput = (
+        buckets,
+        np.bincount(bucket_index, weights=columns['direction'] == DIR_RECV, minlength=len(buckets)).astype(np.int64),
+        np.bincount(bucket_index, weights=columns['direction'] == DIR_SEND, minlength=len(buckets)).astype(np.int64),
+    )
+
+    orders = np.flatnonzero(kinds == KIND_ORDER)
+    orders = orders[np.argsort(keys[orders], kind='stable')]
+    order_keys = keys[orders]
+
+    acks = np.flatnonzero(kinds == KIND_ACK)
+    pos, matched = _lookup(order_keys, keys[acks])
+    order_ack_ms = np.full(len(orders), -1, np.int64)
+    order_ack_ms[pos[matched]] = times[acks[matched]]
+    unmatched_acks = (keys[acks[~matched]], times[acks[~matched]])
+
+    outcomes = np.flatnonzero((kinds == KIND_FILL) | (kinds == KIND_PARTIAL) | (kinds == KIND_REJECT))
+    pos, matched = _lookup(order_keys, keys[outcomes])
+    answered = np.zeros(len(orders), bool)
+    answered[pos[matched]] = True
+    resolved, resolved_order = outcomes[matched], pos[matched]
+    orphans = outcomes[~matched]
+    pending_outcomes = (keys[orphans], times[orphans], kinds[orphans], groups[orphans])
+    open_orders = (order_keys[~answered], groups[orders[~answered]], order_ack_ms[~answered])
+
+    # Orders count in their own group, resolved outcomes in their order's group.
+    count_groups = np.concatenate([groups[orders], groups[orders[resolved_order]]])
+    count_columns = np.concatenate([
+        np.full(len(orders), COUNT_COLUMNS[KIND_ORDER], np.int64),
+        _COUNT_COLUMN_LOOKUP[kinds[resolved]],
+    ])
+    count_keys, inverse = np.unique(count_groups.reshape(-1, 3), axis=0, return_inverse=True)
+    counts = np.zeros((len(count_keys), len(COUNT_COLUMNS)), np.int64)
+    np.add.at(counts, (inverse.ravel(), count_columns), 1)
+
+    acked_fill = (kinds[resolved] != KIND_REJECT) & (order_ack_ms[resolved_order] >= 0)
+    latency = (
+        groups[orders[resolved_order[acked_fill]]],
+        times[resolved[acked_fill]] - order_ack_ms[resolved_order[acked_fill]],
+    )
+
+    return {
+        'persona_names': persona_names,
+        'symbol_names': symbol_names,
+        'last_persona': last_persona,
+        'skipped_lines': skipped,
+        'throughput': throughput,
+        'counts': (count_keys, counts),
+        'latency': latency,
+        'unmatched_acks': unmatched_acks,
+        'pending_outcomes': pending_outcomes,
+        'open_orders': open_orders,
+    }
+
+
+# --- Merging ---
+def _byte_ranges(path, chunk_bytes):
+    size = os.path.getsize(path)
+    return [(start, min(start + chunk_bytes, size)) for start in range(0, size, chunk_bytes)]
+
+
+def _chunk_results(path, bucket_ms, workers, chunk_bytes):
+    """Yield chunk aggregates in file order, keeping at most a few chunks in flight."""
+    ranges = _byte_ranges(path, chunk_bytes)
+    if workers <= 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            yield _aggregate_chunk(path, start, end, bucket_ms)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for start, end in ranges:
+            in_flight.append(pool.submit(_aggregate_chunk, path, start, end, bucket_ms))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+class _Totals:
+    """Running totals merged from chunk aggregates, keyed by global persona/symbol codes."""
+
+    def __init__(self):
+        self.persona_names, self.symbol_names = {}, {}
+        self.current_persona = -1
+        self.skipped_lines = 0
+        self.throughput = {}      # bucket -> [recv, send]
+        self.counts = {}          # (bucket, persona, symbol) -> [orders, fills, partials, rejects]
+        self.latency = {}         # (bucket, persona, symbol) -> [latency arrays]
+        self.open_orders = {}     # order key -> [(bucket, persona, symbol), ack time or -1]
+
+    def _globalize(self, groups, chunk):
+        """Translate chunk-local persona/symbol codes in a (bucket, persona, symbol) array."""
+        groups = groups.reshape(-1, 3).copy()
+        persona_lookup = np.array(
+            [self.persona_names.setdefault(n, len(self.persona_names)) for n in chunk['persona_names']]
+            + [self.current_persona], dtype=np.int64)
+        symbol_lookup = np.array(
+            [self.symbol_names.setdefault(n, len(self.symbol_names)) for n in chunk['symbol_names']] + [-1],
+            dtype=np.int64)
+        groups[:, 1] = persona_lookup[groups[:, 1]]
+        groups[:, 2] = symbol_lookup[groups[:, 2]]
+        return groups
+
+    def _count(self, group, column, n=1):
+        self.counts.setdefault(group, np.zeros(len(COUNT_COLUMNS), np.int64))[column] += n
+
+    def add(self, chunk):
+        self.skipped_lines += chunk['skipped_lines']
+        for bucket, recv, send in zip(*(a.tolist() for a in chunk['throughput'])):
+            totals = self.throughput.setdefault(bucket, [0, 0])
+            totals[0] += recv
+            totals[1] += send
+
+        count_keys, counts = chunk['counts']
+        for group, row in zip(map(tuple, self._globalize(count_keys, chunk).tolist()), counts):
+            self._count(group, slice(None), row)
+
+        latency_groups, latency_values = chunk['latency']
+        if len(latency_values):
+            keys, inverse = np.unique(self._globalize(latency_groups, chunk), axis=0, return_inverse=True)
+            inverse = inverse.ravel()
+            order = np.argsort(inverse, kind='stable')
+            splits = np.searchsorted(inverse[order], np.arange(1, len(keys)))
+            for group, values in zip(map(tuple, keys.tolist()), np.split(latency_values[order], splits)):
+                self.latency.setdefault(group, []).append(values)
+
+        # Resolve joins against orders left open by earlier chunks.
+        for key, ack_ms in zip(*(a.tolist() for a in chunk['unmatched_acks'])):
+            entry = self.open_orders.get(key)
+            if entry is not None and entry[1] < 0:
+                entry[1] = ack_ms
+        keys, times, kinds, groups = chunk['pending_outcomes']
+        groups = self._globalize(groups, chunk)
+        for key, time_ms, kind, own_group in zip(keys.tolist(), times.tolist(), kinds.tolist(), map(tuple, groups.tolist())):
+            entry = self.open_orders.pop(key, None)
+            group = own_group if entry is None else entry[0]
+            self._count(group, COUNT_COLUMNS[kind])
+            if entry is not None and kind != KIND_REJECT and entry[1] >= 0:
+                self.latency.setdefault(group, []).append(np.array([time_ms - entry[1]], np.int64))
+
+        keys, groups, ack_times = chunk['open_orders']
+        for key, group, ack_ms in zip(keys.tolist(), map(tuple, self._globalize(groups, chunk).tolist()), ack_times.tolist()):
+            self.open_orders[key] = [group, ack_ms]
+
+        if chunk['last_persona'] != -1:
+            self.current_persona = self.persona_names[chunk['persona_names'][chunk['last_persona']]]
+
+
+# --- Analytics ---
+def _stats(counts, latencies):
+    orders, fills, partials, rejects = (int(n) for n in counts)
+    latencies = np.concatenate(latencies) if latencies else np.empty(0, np.int64)
+    return {
+        'orders': orders,
+        'fills': fills,
+        'partials': partials,
+        'rejects': rejects,
+        'fill_rate': fills / orders if orders else None,
+        'partial_rate': partials / orders if orders else None,
+        'reject_rate': rejects / orders if orders else None,
+        'latency_ms': (
+            dict(zip(LATENCY_PERCENTILES, np.percentile(latencies, LATENCY_PERCENTILES).tolist()))
+            if len(latencies) else {p: None for p in LATENCY_PERCENTILES}
+        ),
+    }
+
+
+def analyze_log(path, bucket_seconds=60, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Stream a simulator log in byte-range chunks and report throughput and order outcomes.
+
+    Returns throughput per time bucket, plus fill/partial/reject rates and
+    ack-to-fill latency percentiles per persona/symbol, overall and per bucket.
+    Outcomes are counted in the bucket of the order they answer.
+    """
+    if bucket_seconds <= 0:
+        raise ValueError(f"bucket_seconds must be positive, got {bucket_seconds}")
+    if chunk_bytes <= 0:
+        raise ValueError(f"chunk_bytes must be positive, got {chunk_bytes}")
+    bucket_ms = bucket_seconds * 1000
+    workers = workers or os.cpu_count() or 1
+    totals = _Totals()
+    for chunk in _chunk_results(path, bucket_ms, workers, chunk_bytes):
+        totals.add(chunk)
+
+    persona_names, symbol_names = list(totals.persona_names), list(totals.symbol_names)
+
+    def labels(persona, symbol):
+        return {
+            'persona': persona_names[persona] if persona != -1 else 'unknown',
+            'symbol': symbol_names[symbol] if symbol != -1 else 'unknown',
+        }
+
+    throughput = [
+        {'bucket_start_ms': bucket, 'recv': recv, 'send': send, 'msgs_per_sec': (recv + send) / bucket_seconds}
+        for bucket, (recv, send) in sorted(totals.throughput.items())
+    ]
+
+    per_bucket, by_symbol = [], {}
+    for group in sorted(totals.counts):
+        bucket, persona, symbol = group
+        counts, latencies = totals.counts[group], totals.latency.get(group, [])
+        per_bucket.append({'bucket_start_ms': bucket, **labels(persona, symbol), **_stats(counts, latencies)})
+        merged = by_symbol.setdefault((persona, symbol), [np.zeros(len(COUNT_COLUMNS), np.int64), []])
+        merged[0] += counts
+        merged[1].extend(latencies)
+
+    # Sorting by persona name rather than code keeps the output independent of chunking.
+    per_bucket.sort(key=lambda row: (row['bucket_start_ms'], row['persona'], row['symbol']))
+    summary = sorted(
+        ({**labels(*key), **_stats(counts, latencies)} for key, (counts, latencies) in by_symbol.items()),
+        key=lambda row: (row['persona'], row['symbol']),
+    )
+    return {
+        'throughput': throughput,
+        'summary': summary,
+        'per_bucket': per_bucket,
+        'skipped_lines': totals.skipped_lines,
+    }
+
+
+# --- Report formatting ---
+def _fmt_time(ms):
+    return dt.datetime.utcfromtimestamp(ms / 1000).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _fmt_rate(value):
+    return "-" if value is None else f"{value * 100:.1f}%"
+
+
+def _fmt_latency(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+def _stats_columns(row):
+    return [
+        str(row['orders']), str(row['fills']), str(row['partials']), str(row['rejects']),
+        _fmt_rate(row['fill_rate']), _fmt_rate(row['partial_rate']), _fmt_rate(row['reject_rate']),
+    ] + [_fmt_latency(row['latency_ms'][p]) for p in LATENCY_PERCENTILES]
+
+
+def _table(headers, rows):
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    lines = ["  ".join(str(cell).ljust(width) for cell, width in zip(headers, widths))]
+    lines.append("  ".join("-" * width for width in widths))
+    lines.extend("  ".join(str(cell).ljust(width) for cell, width in zip(row, widths)) for row in rows)
+    return "\n".join(lines)
+
+
+def format_report(report):
+    stats_headers = ["Orders", "Fills", "Partials", "Rejects", "Fill%", "Partial%", "Reject%"]
+    stats_headers += [f"p{p} ms" for p in LATENCY_PERCENTILES]
+
+    sections = [
+        "Throughput",
+        _table(
+            ["Bucket (UTC)", "Recv", "Send", "Msgs/s"],
+            [[_fmt_time(r['bucket_start_ms']), r['recv'], r['send'], f"{r['msgs_per_sec']:.2f}"] for r in report['throughput']],
+        ),
+        "",
+        "Order outcomes and ack-to-fill latency by persona/symbol",
+        _table(
+            ["Persona", "Symbol"] + stats_headers,
+            [[r['persona'], r['symbol']] + _stats_columns(r) for r in report['summary']],
+        ),
+        "",
+        "Order outcomes and ack-to-fill latency by time bucket",
+        _table(
+            ["Bucket (UTC)", "Persona", "Symbol"] + stats_headers,
+            [[_fmt_time(r['bucket_start_ms']), r['persona'], r['symbol']] + _stats_columns(r) for r in report['per_bucket']],
+        ),
+        "",
+        f"Skipped {report['skipped_lines']} unparseable wire log line(s).",
+    ]
+    return "\n".join(sections)
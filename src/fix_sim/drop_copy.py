@@ -0,0 +1,169 @@
+import collections
+import socket
+import threading
+import time
+import logging
+
+logger = logging.getLogger("FIX_SIM")
+
+# Slow-subscriber policies.
+POLICY_DISCONNECT = "disconnect"  # Close the drop-copy session once it falls behind.
+POLICY_DROP = "drop"              # Keep the session, discard reports it has no room for.
+
+DEFAULT_SETTINGS = {
+    'sender_comp_ids': ["DROPCOPY"],
+    'max_queue_depth': 10000,
+    'max_lag_ms': 0,
+    'slow_subscriber_policy': POLICY_DISCONNECT,
+}
+
+
+class DropCopySubscriber:
+    """A single drop-copy session fed from a bounded queue by its own writer thread.
+
+    Queue entries are (enqueue_time, payload) tuples where payload is the
+    already-encoded report shared by every subscriber, so fan-out never
+    copies the message bytes. Lag is measured from the oldest report not yet
+    written out (including one stuck in a blocking send), and is checked on
+    every offer so a stalled writer cannot hide a slow subscriber.
+    """
+
+    def __init__(self, hub, sock, name):
+        self.hub = hub
+        self.sock = sock
+        self.name = name
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+        self._pending = collections.deque()
+        self._in_flight_at = None
+        self._cond = threading.Condition(threading.Lock())
+        self._writer = threading.Thread(target=self._drain, name=f"dropcopy-{name}", daemon=True)
+        self._writer.start()
+
+    def _lag_ms(self, now):
+        oldest = self._in_flight_at
+        if oldest is None and self._pending:
+            oldest = self._pending[0][0]
+        return 0.0 if oldest is None else (now - oldest) * 1000
+
+    def offer(self, enqueued_at, payload):
+        with self._cond:
+            if self.closed:
+                return
+            lag_ms = self._lag_ms(enqueued_at)
+            if len(self._pending) >= self.hub.max_queue_depth:
+                reason = f"queue depth limit of {self.hub.max_queue_depth} reached"
+            elif self.hub.max_lag_ms and lag_ms > self.hub.max_lag_ms:
+                reason = f"lag of {lag_ms:.0f}ms exceeds {self.hub.max_lag_ms:.0f}ms limit"
+            else:
+                self._pending.append((enqueued_at, payload))
+                self._cond.notify()
+                return
+        self._fall_behind(reason)
+
+    def _drain(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self.closed:
+                    self._cond.wait()
+                if self.closed:
+                    return
+                enqueued_at, payload = self._pending.popleft()
+                lag_ms = (time.monotonic() - enqueued_at) * 1000
+                stale = self.hub.max_lag_ms and lag_ms > self.hub.max_lag_ms
+                if not stale:
+                    self._in_flight_at = enqueued_at
+            if stale:
+                self._fall_behind(f"lag of {lag_ms:.0f}ms exceeds {self.hub.max_lag_ms:.0f}ms limit")
+                continue
+            try:
+                self.sock.sendall(payload)
+            except OSError as e:
+                if not self.closed:
+                    logger.warning(f"Drop-copy subscriber {self.name} send failed: {e}")
+                self.close()
+                return
+            with self._cond:
+                self._in_flight_at = None
+                self.delivered += 1
+
+    def _fall_behind(self, reason):
+        """Discard the report that could not be queued or sent in time, applying the slow-subscriber policy."""
+        if self.hub.slow_subscriber_policy == POLICY_DROP:
+            with self._cond:
+                self.dropped += 1
+            return
+        logger.warning(f"Drop-copy subscriber {self.name} is too slow ({reason}). Disconnecting.")
+        self.close()
+
+    def join(self, timeout=None):
+        """Wait for the writer thread to exit; returns True if it has."""
+        self._writer.join(timeout)
+        return not self._writer.is_alive()
+
+    def stats(self):
+        with self._cond:
+            return self.delivered, self.dropped
+
+    def close(self):
+        with self._cond:
+            if self.closed:
+                return
+            self.closed = True
+            self.dropped += len(self._pending)
+            self._pending.clear()
+            self._cond.notify_all()
+        self.hub.unsubscribe(self)
+        try:
+            # Unblocks both the session handler's recv() and a writer stuck in sendall().
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class DropCopyHub:
+    """Fans out every ExecutionReport sent to trading sessions to all drop-copy subscribers."""
+
+    def __init__(self, settings=None):
+        settings = {**DEFAULT_SETTINGS, **(settings or {})}
+        self.sender_comp_ids = {str(s) for s in settings['sender_comp_ids']}
+        self.max_queue_depth = int(settings['max_queue_depth'])
+        self.max_lag_ms = float(settings['max_lag_ms'])
+        self.slow_subscriber_policy = settings['slow_subscriber_policy']
+        if self.slow_subscriber_policy not in (POLICY_DISCONNECT, POLICY_DROP):
+            raise ValueError(f"Unknown slow_subscriber_policy '{self.slow_subscriber_policy}'")
+        self._lock = threading.Lock()
+        self._subscribers = ()
+
+    @property
+    def subscribers(self):
+        return self._subscribers
+
+    def is_drop_copy_session(self, sender_comp_id: str) -> bool:
+        return sender_comp_id in self.sender_comp_ids
+
+    def subscribe(self, sock, name) -> DropCopySubscriber:
+        subscriber = DropCopySubscriber(self, sock, name)
+        with self._lock:
+            self._subscribers = self._subscribers + (subscriber,)
+        logger.info(f"Drop-copy subscriber {name} attached ({len(self._subscribers)} active).")
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            if subscriber not in self._subscribers:
+                return
+            self._subscribers = tuple(s for s in self._subscribers if s is not subscriber)
+        delivered, dropped = subscriber.stats()
+        logger.info(f"Drop-copy subscriber {subscriber.name} detached: {delivered} delivered, {dropped} dropped.")
+
+    def publish(self, payload: bytes):
+        # The subscriber tuple is replaced, never mutated, so iterating over a
+        # snapshot without holding the lock is safe.
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+        enqueued_at = time.monotonic()
+        for subscriber in subscribers:
+            subscriber.offer(enqueued_at, payload)
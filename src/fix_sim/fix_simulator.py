@@ -9,6 +9,7 @@ import sys
 import logging
 import os
 from .fix_protocol import FixProtocol
+from .drop_copy import DropCopyHub
 
 # --- Global Configuration ---
 HOST, PORT = "localhost", 9898
@@ -62,6 +63,8 @@ class FixSimulatorHandler(socketserver.BaseRequestHandler):
         # any attributes needed inside handle() must be initialized *before*
         # calling super().__init__().
         self.lp_settings = server.lp_settings
+        self.drop_copy_hub = server.drop_copy_hub
+        self.drop_copy_subscriber = None
         self.protocol = None
         super().__init__(request, client_address, server)
 
@@ -81,6 +84,9 @@ class FixSimulatorHandler(socketserver.BaseRequestHandler):
                     self.process_fix_message(msg)
         except Exception as e:
             logger.error(f"Error on connection {self.client_address}: {e}")
+        finally:
+            if self.drop_copy_subscriber is not None:
+                self.drop_copy_subscriber.close()
 
     def process_fix_message(self, msg: simplefix.FixMessage):
         if self.protocol is None:
@@ -106,7 +112,11 @@ class FixSimulatorHandler(socketserver.BaseRequestHandler):
         logger.info(f"<<< RECV: {log_msg_str}")
         
         msg_type = msg.get(35).decode()
-        if msg_type == 'A': self.handle_logon(msg)
+        # Once subscribed, the drop-copy writer thread owns the socket, so the
+        # session must not send anything else, not even a repeated Logon reply.
+        if self.drop_copy_subscriber is not None:
+            logger.warning(f"Ignoring MsgType={msg_type} on drop-copy session {self.client_address}.")
+        elif msg_type == 'A': self.handle_logon(msg)
         elif msg_type == 'D': self.handle_new_order_single(msg)
         elif msg_type == 'F': self.handle_cancel_request(msg)
         elif msg_type == 'G': self.handle_replace_request(msg)
@@ -116,6 +126,11 @@ class FixSimulatorHandler(socketserver.BaseRequestHandler):
         response.append_pair(98, 0)
         response.append_pair(108, 30)
         self.send_message(response)
+
+        sender_comp_id = msg.get(49).decode() if 49 in msg else ""
+        if self.drop_copy_hub.is_drop_copy_session(sender_comp_id):
+            logger.info(f"Session {self.client_address} logged on as drop-copy subscriber {sender_comp_id}.")
+            self.drop_copy_subscriber = self.drop_copy_hub.subscribe(self.request, f"{sender_comp_id}@{self.client_address[0]}:{self.client_address[1]}")
     
     def handle_new_order_single(self, order_msg: simplefix.FixMessage):
         cl_ord_id = order_msg.get(11)
@@ -167,9 +182,13 @@ class FixSimulatorHandler(socketserver.BaseRequestHandler):
         self.send_message(exec_report)
 
     def send_message(self, msg: simplefix.FixMessage):
-        log_msg_str = msg.encode().decode().replace('\x01', '|')
+        # Encode once: the same bytes are logged, sent, and shared with drop-copy subscribers.
+        payload = msg.encode()
+        log_msg_str = payload.decode().replace('\x01', '|')
         logger.info(f">>> SEND: {log_msg_str}")
-        self.request.sendall(msg.encode())
+        self.request.sendall(payload)
+        if self.drop_copy_subscriber is None and msg.get(35) == b'8':
+            self.drop_copy_hub.publish(payload)
         
     def create_base_message(self, msg_type: str) -> simplefix.FixMessage:
         msg = simplefix.FixMessage()
@@ -205,9 +224,20 @@ def run_server(persona, host, port, custom_dict_path=None):
         logger.critical(f"Failed to load persona '{persona}': {e}")
         return
 
-    class FixTCPServer(socketserver.TCPServer):
+    try:
+        drop_copy_hub = DropCopyHub(config.get('drop_copy'))
+    except Exception as e:
+        logger.critical(f"Invalid drop_copy configuration: {e}")
+        return
+
+    # Sessions are served on their own threads so drop-copy subscribers can
+    # stay connected while trading sessions come and go.
+    class FixTCPServer(socketserver.ThreadingTCPServer):
+        daemon_threads = True
+
         def __init__(self, server_address, RequestHandlerClass):
             self.lp_settings = lp_settings
+            self.drop_copy_hub = drop_copy_hub
             # We don't actually need custom_dict_path here anymore as it's not used by the handler
             super().__init__(server_address, RequestHandlerClass)
     
@@ -0,0 +1,108 @@
+import threading
+import time
+
+from src.fix_sim.drop_copy import DropCopyHub, POLICY_DISCONNECT, POLICY_DROP
+
+
+class BlockingSocket:
+    """Stands in for a subscriber socket whose peer stops reading."""
+
+    def __init__(self):
+        self.sent = []
+        self.sending = threading.Event()
+        self.release = threading.Event()
+        self.shut_down = False
+
+    def sendall(self, payload):
+        self.sending.set()
+        self.release.wait()
+        if self.shut_down:
+            raise OSError("socket shut down")
+        self.sent.append(payload)
+
+    def shutdown(self, how):
+        self.shut_down = True
+        self.release.set()
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+def make_subscriber(**settings):
+    hub = DropCopyHub(settings)
+    sock = BlockingSocket()
+    return hub, sock, hub.subscribe(sock, "test")
+
+
+def test_drop_policy_discards_reports_beyond_queue_depth():
+    hub, sock, subscriber = make_subscriber(max_queue_depth=2, slow_subscriber_policy=POLICY_DROP)
+    hub.publish(b"0")
+    assert sock.sending.wait(2)
+    for i in range(1, 10):
+        hub.publish(str(i).encode())
+
+    sock.release.set()
+    wait_for(lambda: subscriber.stats()[0] == 3)
+    assert sock.sent == [b"0", b"1", b"2"]
+    assert subscriber.stats() == (3, 7)
+    assert not subscriber.closed
+
+
+def test_drop_policy_discards_stale_reports_while_writer_is_blocked():
+    hub, sock, subscriber = make_subscriber(max_lag_ms=50, slow_subscriber_policy=POLICY_DROP)
+    hub.publish(b"0")
+    assert sock.sending.wait(2)
+    time.sleep(0.1)
+    for i in range(1, 6):
+        hub.publish(str(i).encode())
+    assert subscriber.stats() == (0, 5)
+
+    sock.release.set()
+    wait_for(lambda: subscriber.stats()[0] == 1)
+    assert sock.sent == [b"0"]
+    assert subscriber.stats() == (1, 5)
+    assert not subscriber.closed
+
+
+def test_drop_policy_discards_reports_that_aged_in_the_queue():
+    hub, sock, subscriber = make_subscriber(max_lag_ms=50, slow_subscriber_policy=POLICY_DROP)
+    hub.publish(b"0")
+    assert sock.sending.wait(2)
+    hub.publish(b"1")
+    time.sleep(0.1)
+
+    sock.release.set()
+    wait_for(lambda: sum(subscriber.stats()) == 2)
+    assert sock.sent == [b"0"]
+    assert subscriber.stats() == (1, 1)
+
+
+def test_disconnect_policy_closes_on_lag_without_waiting_for_writer():
+    hub, sock, subscriber = make_subscriber(max_lag_ms=50, slow_subscriber_policy=POLICY_DISCONNECT)
+    hub.publish(b"0")
+    assert sock.sending.wait(2)
+    time.sleep(0.1)
+    hub.publish(b"1")
+
+    assert subscriber.closed
+    assert sock.shut_down
+    assert hub.subscribers == ()
+    assert subscriber.join(2)
+    assert sock.sent == []
+
+
+def test_disconnect_policy_closes_when_queue_depth_exceeded():
+    hub, sock, subscriber = make_subscriber(max_queue_depth=2, slow_subscriber_policy=POLICY_DISCONNECT)
+    hub.publish(b"0")
+    assert sock.sending.wait(2)
+    for i in range(1, 4):
+        hub.publish(str(i).encode())
+
+    assert subscriber.closed
+    assert hub.subscribers == ()
+    assert subscriber.stats() == (0, 2)
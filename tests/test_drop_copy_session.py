@@ -0,0 +1,133 @@
+import importlib
+import os
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+import simplefix
+
+from src.fix_sim.drop_copy import DropCopyHub
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LP_SETTINGS = {'fill_rate': 0.5, 'partial_fill_rate': 0.3, 'avg_latency_ms': 0, 'latency_jitter_ms': 0}
+ORDERS = 20
+
+
+@pytest.fixture
+def simulator(tmp_path, monkeypatch):
+    # The simulator module opens its log file relative to the working directory on import.
+    monkeypatch.chdir(tmp_path)
+    fix_simulator = importlib.import_module("src.fix_sim.fix_simulator")
+    monkeypatch.setattr(fix_simulator, "DICT_PATH_PREFIX", os.path.join(REPO_ROOT, "dict"))
+
+    hub = DropCopyHub({'max_lag_ms': 0})
+
+    class Server(socketserver.ThreadingTCPServer):
+        daemon_threads = True
+
+        def __init__(self):
+            self.lp_settings = LP_SETTINGS
+            self.drop_copy_hub = hub
+            super().__init__(("localhost", 0), fix_simulator.FixSimulatorHandler)
+
+    server = Server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server, hub
+    server.shutdown()
+    server.server_close()
+
+
+class Session:
+    def __init__(self, server, sender_comp_id):
+        self.sender_comp_id = sender_comp_id
+        self.sock = socket.create_connection(server.server_address, timeout=5)
+        self.raw = b""
+        self.frames = []
+        self.parser = simplefix.FixParser()
+
+    def send(self, msg_type, *pairs):
+        msg = simplefix.FixMessage()
+        msg.append_pair(8, "FIX.4.2")
+        msg.append_pair(35, msg_type)
+        msg.append_pair(49, self.sender_comp_id)
+        msg.append_pair(56, "SIMULATOR")
+        msg.append_pair(34, 1)
+        msg.append_pair(52, "20261019-10:00:00.000")
+        for tag, value in pairs:
+            msg.append_pair(tag, value)
+        self.sock.sendall(msg.encode())
+
+    def logon(self):
+        self.send("A", (98, 0), (108, 30))
+        assert self.read_frames(1)[0].get(35) == b"A"
+
+    def read_frames(self, count, timeout=5.0):
+        """Read until `count` more messages have arrived; returns the new messages."""
+        start = len(self.frames)
+        deadline = time.monotonic() + timeout
+        while len(self.frames) - start < count:
+            self.sock.settimeout(max(0.01, deadline - time.monotonic()))
+            data = self.sock.recv(65536)
+            if not data:
+                break
+            self.raw += data
+            self.parser.append_buffer(data)
+            while (msg := self.parser.get_message()) is not None:
+                self.frames.append(msg)
+        return self.frames[start:]
+
+    def close(self):
+        self.sock.close()
+
+
+def order_pairs(cl_ord_id):
+    return [(11, cl_ord_id), (55, "EUR/USD"), (54, "1"), (60, "20261019-10:00:00"), (38, 100), (40, "2"), (44, "1.1")]
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def test_drop_copy_session_receives_trading_execution_reports(simulator):
+    server, hub = simulator
+
+    drop_copy = Session(server, "DROPCOPY")
+    drop_copy.logon()
+    wait_for(lambda: len(hub.subscribers) == 1)
+    logon_bytes = len(drop_copy.raw)
+
+    # Order flow and a repeated Logon on the drop-copy session are ignored, not answered.
+    drop_copy.send("A", (98, 0), (108, 30))
+    drop_copy.send("D", *order_pairs("DC_ORDER"))
+    drop_copy.send("F", (41, "DC_ORDER"), (11, "DC_CANCEL"), (55, "EUR/USD"), (54, "1"), (60, "20261019-10:00:00"))
+    drop_copy.send("G", (41, "DC_ORDER"), *order_pairs("DC_REPLACE"))
+
+    trading = Session(server, "BRIDGE")
+    trading.logon()
+    trading_logon_bytes = len(trading.raw)
+    for i in range(ORDERS):
+        trading.send("D", *order_pairs(f"ORD_{i}"))
+    trading.send("F", (41, "ORD_0"), (11, "CNL_0"), (55, "EUR/USD"), (54, "1"), (60, "20261019-10:00:00"))
+    trading.send("G", (41, "ORD_1"), *order_pairs("MOD_1"))
+
+    expected = 2 * ORDERS + 2
+    reports = trading.read_frames(expected)
+    assert len(reports) == expected
+    assert all(msg.get(35) == b"8" for msg in reports)
+
+    copies = drop_copy.read_frames(expected)
+    assert drop_copy.raw[logon_bytes:] == trading.raw[trading_logon_bytes:]
+    # Nothing beyond the trading session's reports reaches the drop-copy session.
+    with pytest.raises(socket.timeout):
+        drop_copy.read_frames(1, timeout=0.3)
+    assert len(copies) == expected
+
+    drop_copy.close()
+    wait_for(lambda: hub.subscribers == ())
+    trading.close()
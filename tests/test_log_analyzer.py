@@ -0,0 +1,112 @@
+import calendar
+import time
+
+import pytest
+
+from src.fix_analysis import log_analyzer
+
+
+def _stamp(ms):
+    return time.strftime("%Y%m%d-%H:%M:%S", time.gmtime(ms // 1000)) + f".{ms % 1000:03d}"
+
+
+def _line(direction, ms, body):
+    marker = "<<< RECV" if direction == "recv" else ">>> SEND"
+    return f"2026-10-19 10:00:00 - FIX_SIM - INFO - {marker}: 8=FIX.4.2|9=1|52={_stamp(ms)}|{body}10=000|"
+
+
+def write_log(path, personas=("Fast_ECN", "Slow_Aggregator"), orders_per_persona=300):
+    """Write a deterministic log: every 4th order rejects, every 10th partially fills, fills take 40ms."""
+    base_ms = calendar.timegm((2026, 10, 19, 10, 0, 0)) * 1000
+    lines, t = [], base_ms
+    for persona in personas:
+        lines.append(f"2026-10-19 10:00:00 - FIX_SIM - INFO - Loaded config. Running as LP Persona: '{persona}'")
+        lines.append(_line("recv", t, "35=A|49=BRIDGE|98=0|108=30|"))
+        for i in range(orders_per_persona):
+            t += 97
+            symbol = ("EUR/USD", "USD/JPY")[i % 2]
+            cl_ord_id = f"ORD_{persona}_{i}"
+            exec_type = "8" if i % 4 == 0 else "1" if i % 10 == 5 else "2"
+            lines.append(_line("recv", t, f"35=D|11={cl_ord_id}|55={symbol}|54=1|38=100|"))
+            lines.append(_line("send", t + 1, f"35=8|11={cl_ord_id}|150=0|39=0|55={symbol}|"))
+            lines.append(_line("send", t + 41, f"35=8|11={cl_ord_id}|150={exec_type}|39={exec_type}|55={symbol}|"))
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.fixture
+def sim_log(tmp_path):
+    return write_log(tmp_path / "fix_simulator.log")
+
+
+def test_results_do_not_depend_on_chunking_or_workers(sim_log):
+    expected = log_analyzer.analyze_log(str(sim_log), 10, workers=1, chunk_bytes=1 << 30)
+    for chunk_bytes in (1000, 4096, 77777):
+        for workers in (1, 2):
+            assert log_analyzer.analyze_log(str(sim_log), 10, workers, chunk_bytes) == expected
+
+
+def test_summary_counts_rates_and_latency(sim_log):
+    report = log_analyzer.analyze_log(str(sim_log), 10, workers=1, chunk_bytes=1000)
+    rows = {(r['persona'], r['symbol']): r for r in report['summary']}
+    assert set(rows) == {(p, s) for p in ("Fast_ECN", "Slow_Aggregator") for s in ("EUR/USD", "USD/JPY")}
+
+    # Even order numbers trade EUR/USD: 75 of 150 reject, the rest fill in full.
+    eur = rows[("Fast_ECN", "EUR/USD")]
+    assert (eur['orders'], eur['fills'], eur['partials'], eur['rejects']) == (150, 75, 0, 75)
+    assert eur['reject_rate'] == pytest.approx(0.5)
+    assert eur['latency_ms'] == {50: 40.0, 90: 40.0, 99: 40.0}
+
+    jpy = rows[("Slow_Aggregator", "USD/JPY")]
+    assert (jpy['orders'], jpy['fills'], jpy['partials'], jpy['rejects']) == (150, 120, 30, 0)
+
+
+def test_outcomes_count_in_their_orders_bucket(sim_log):
+    report = log_analyzer.analyze_log(str(sim_log), 1, workers=1, chunk_bytes=1000)
+    for row in report['per_bucket']:
+        assert row['fills'] + row['partials'] + row['rejects'] == row['orders']
+    recv = sum(r['recv'] for r in report['throughput'])
+    send = sum(r['send'] for r in report['throughput'])
+    assert (recv, send) == (602, 1200)
+
+
+def test_empty_log(tmp_path):
+    path = tmp_path / "empty.log"
+    path.write_text("")
+    assert log_analyzer.analyze_log(str(path)) == {'throughput': [], 'summary': [], 'per_bucket': [], 'skipped_lines': 0}
+
+
+def test_unparseable_lines_are_skipped_and_counted(sim_log):
+    expected = log_analyzer.analyze_log(str(sim_log), 10, workers=1, chunk_bytes=1 << 30)
+    lines = sim_log.read_text().splitlines()
+    # The first wire line of the second persona is its Logon, so outcome stats are unaffected.
+    middle = next(i for i in range(len(lines) // 2, len(lines)) if "|52=" in lines[i])
+    corrupt = [
+        lines[middle].replace("|52=", "|52=2026XX19-1"),
+        "garbage-prefix - FIX_SIM - INFO - >>> SEND: 8=FIX.4.2|35=0|",
+    ]
+    sim_log.write_text("\n".join(lines[:middle] + corrupt + lines[middle + 1:]) + "\n")
+
+    for chunk_bytes in (4096, 1 << 30):
+        report = log_analyzer.analyze_log(str(sim_log), 10, workers=1, chunk_bytes=chunk_bytes)
+        assert report['skipped_lines'] == 2
+        assert report['summary'] == expected['summary']
+    assert "Skipped 2 unparseable" in log_analyzer.format_report(report)
+
+
+@pytest.mark.parametrize("kwargs", [{'bucket_seconds': 0}, {'bucket_seconds': -5}, {'chunk_bytes': 0}])
+def test_rejects_non_positive_bucket_and_chunk_size(sim_log, kwargs):
+    with pytest.raises(ValueError):
+        log_analyzer.analyze_log(str(sim_log), **kwargs)
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="requires time.tzset")
+def test_log_timestamp_is_local_time(monkeypatch):
+    monkeypatch.setenv("TZ", "EST+05")
+    time.tzset()
+    try:
+        line = b"2026-01-01 00:00:00 - FIX_SIM - INFO - <<< RECV: 8=FIX.4.2|"
+        assert log_analyzer._log_time_ms(line) == (calendar.timegm((2026, 1, 1, 5, 0, 0)) * 1000)
+    finally:
+        monkeypatch.undo()
+        time.tzset()